@@ -1,15 +1,256 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
+import threading
+from collections.abc import Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import pagerduty
+import requests
 
 from airflow.exceptions import AirflowException
-from airflow.hooks.base import BaseHook
+from airflow.providers.pagerduty.hooks.ApiClient import (
+    _build_headers,
+    _get_session,
+    _resolve_integration_key,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401  # httpx needs the h2 extra to negotiate HTTP/2
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+_EVENTS_ENQUEUE_URL = "https://events.pagerduty.com/v2/enqueue"
+
+_CLIENT_ERRORS: tuple[type[Exception], ...] = (
+    pagerduty.Error,
+    requests.RequestException,
+) + ((httpx.HTTPError,) if _HAS_HTTPX else ())
+
+_http_client = None
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Return the shared HTTP/2-capable httpx client, created on first use.
+
+    HTTP/2 multiplexes concurrent event submissions over a single TCP+TLS
+    connection, where the HTTP/1.1 pool in requests needs one connection per
+    in-flight request.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=60,
+        )
+    return _http_client
+
+
+_async_client = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared httpx.AsyncClient, created lazily on first use.
+
+    Must be called from within a running event loop; the client is closed at
+    interpreter exit so pending connections are torn down cleanly.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=60,
+        )
+        atexit.register(_close_async_client)
+    return _async_client
+
+
+def _close_async_client() -> None:
+    """Close the shared async client, if one was created."""
+    global _async_client
+    if _async_client is not None:
+        try:
+            asyncio.run(_async_client.aclose())
+        except RuntimeError:
+            # A loop is still running at exit; the transport is dropped with
+            # the process.
+            pass
+        _async_client = None
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    """
+    Serialize an event payload to JSON bytes.
+
+    Uses the C-backed orjson encoder when available; event payloads carry
+    arbitrarily nested ``custom_details``/``images``/``links`` structures and the
+    stdlib encoder is a measurable cost when DAGs emit events in bulk.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+@dataclass
+class EventPayload:
+    """
+    A single Events API v2 event, validated once at construction.
+
+    Fields map directly onto the enqueue request body; optional fields left as
+    ``None`` are omitted when the body is built, so the per-event cost is one
+    dataclass construction instead of repeated keyword re-binding.
+    """
+
+    summary: str
+    severity: str
+    source: str
+    custom_details: dict[str, Any] | None = None
+    component: str | None = None
+    group: str | None = None
+    class_type: str | None = None
+    action: str = "trigger"
+    dedup_key: str | None = None
+    images: list[dict[str, Any]] | None = None
+    links: list[dict[str, Any]] | None = None
+
+    def __post_init__(self) -> None:
+        actions = ("trigger", "acknowledge", "resolve")
+        if self.action not in actions:
+            raise ValueError(f"Event action must be one of: {', '.join(actions)}")
+        if not self.dedup_key and self.action != "trigger":
+            raise ValueError(
+                f"The dedup_key property is required for action={self.action} events,"
+                " and it must be a string."
+            )
+
+    def as_data(self, routing_key: str) -> dict[str, Any]:
+        """Build the enqueue request body, omitting optional fields left unset."""
+        payload: dict[str, Any] = {
+            "summary": self.summary,
+            "severity": self.severity,
+            "source": self.source,
+        }
+        if self.custom_details is not None:
+            payload["custom_details"] = self.custom_details
+        if self.component:
+            payload["component"] = self.component
+        if self.group:
+            payload["group"] = self.group
+        if self.class_type:
+            payload["class"] = self.class_type
+
+        data: dict[str, Any] = {
+            "event_action": self.action,
+            "routing_key": routing_key,
+            "payload": payload,
+        }
+        if self.dedup_key:
+            data["dedup_key"] = self.dedup_key
+        if self.images is not None:
+            data["images"] = self.images
+        if self.links is not None:
+            data["links"] = self.links
+        return data
+
+
+class _BatchQueue:
+    """
+    Bounded in-process buffer that decouples event submission from the network.
+
+    Payloads accumulate until either ``maxsize`` of them are pending or the flusher
+    thread wakes after ``max_latency`` seconds, then drain over the shared
+    keep-alive session off the caller's thread. The Events API v2 enqueue endpoint
+    accepts one event per request, so draining posts per event; each Future
+    resolves with its own event's response.
+    """
+
+    def __init__(self, session: requests.Session, maxsize: int = 50, max_latency: float = 5.0) -> None:
+        self._session = session
+        self.maxsize = maxsize
+        self.max_latency = max_latency
+        self._lock = threading.Lock()
+        self._pending: list[tuple[dict[str, Any], Future]] = []
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def put(self, payload: dict[str, Any]) -> Future:
+        """Enqueue a payload and return a Future resolved once its batch is posted."""
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((payload, future))
+            full = len(self._pending) >= self.maxsize
+            self._ensure_flusher()
+        if full:
+            self._wakeup.set()
+        return future
+
+    def _ensure_flusher(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="pagerduty-event-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(timeout=self.max_latency)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Drain the queue, resolving each Future with its own event's response."""
+        while True:
+            with self._lock:
+                batch = self._pending[: self.maxsize]
+                del self._pending[: self.maxsize]
+            if not batch:
+                return
+            for payload, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    response = self._session.request(
+                        "POST",
+                        _EVENTS_ENQUEUE_URL,
+                        data=_encode(payload),
+                        headers={"Content-Type": "application/json"},
+                    )
+                    response.raise_for_status()
+                    result = response.json()
+                except Exception as e:
+                    future.set_exception(AirflowException(f"Failed to post event: {e}"))
+                else:
+                    future.set_result(result)
+
+
+@lru_cache(maxsize=32)
+def _get_batch_queue(integration_key: str) -> _BatchQueue:
+    """Return the shared batch queue for an integration key, drained at interpreter exit."""
+    queue = _BatchQueue(_get_session(integration_key))
+    atexit.register(queue.flush)
+    return queue
+
+
 class EventsAPiV2Client:
     """
     The EventsAPiV2Client is a client for the PagerDuty Events API V2.
@@ -22,8 +263,7 @@ class EventsAPiV2Client:
         self._session = None
 
         if pagerduty_events_conn_id is not None:
-            conn = self.get_connection(pagerduty_events_conn_id)
-            self.integration_key = conn.get_password()
+            self.integration_key = _resolve_integration_key(pagerduty_events_conn_id)
 
         if integration_key is not None:  # token takes higher priority
             self.integration_key = integration_key
@@ -32,15 +272,48 @@ class EventsAPiV2Client:
             raise AirflowException(
                 "Cannot get token: No valid integration key nor pagerduty_events_conn_id supplied."
             )
+
+        self._headers = _build_headers(self.integration_key)
+        self._session = _get_session(self.integration_key)
+        self._batch_queue = _get_batch_queue(self.integration_key)
+
+    def _post_enqueue(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Post a request body to the enqueue endpoint and return the parsed response.
+
+        Goes over the shared HTTP/2 client when httpx is available, falling back to
+        the pooled requests session otherwise.
+        """
+        if _HAS_HTTPX:
+            response = _get_http_client().post(
+                _EVENTS_ENQUEUE_URL, content=_encode(data), headers=dict(self._headers)
+            )
+            response.raise_for_status()
+            return response.json()
+        response = self._session.request(
+            "POST",
+            _EVENTS_ENQUEUE_URL,
+            data=_encode(data),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return response.json()
+
     def acknowledge_event(self, event_id: str) -> None:
         """
         Acknowledge an event in PagerDuty.
 
-        :param event_id: The ID of the event to acknowledge.
+        :param event_id: The dedup key of the event to acknowledge.
         """
         try:
-            self._session.acknowledge_event(event_id)
-        except pagerduty.PagerDutyError as e:
+            self._post_enqueue(
+                {
+                    "routing_key": self.integration_key,
+                    "event_action": "acknowledge",
+                    "dedup_key": event_id,
+                }
+            )
+        except _CLIENT_ERRORS as e:
             raise AirflowException(f"Failed to acknowledge event: {e}") from e
 
     def post_event(self, payload: dict[str, Any]) -> str:
@@ -51,30 +324,48 @@ class EventsAPiV2Client:
         :return: The ID of the created event.
         """
         try:
-            response = self._session.post_event(payload)
-            return response['event']['id']
-        except pagerduty.PagerDutyError as e:
+            return self._post_enqueue(payload)['event']['id']
+        except _CLIENT_ERRORS as e:
             raise AirflowException(f"Failed to post event: {e}") from e
 
-    def prepare_headers(self) -> dict[str, str]:
+    def flush(self) -> None:
+        """Drain any batched events that have not been posted yet."""
+        self._batch_queue.flush()
+
+    def prepare_headers(self) -> Mapping[str, str]:
         """
-        Prepare the headers for the API request.
+        Return the headers for the API request, built once at construction time.
 
         :return: The headers for the API request.
         """
-        return {
-            'Authorization': f'Token token={self.integration_key}',
-            'Content-Type': 'application/json',
-        }
+        return self._headers
+
+    def prepare_payload(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Build the Events API v2 request body for a single event.
+
+        Accepts the ``EventPayload`` fields as keyword arguments; validation and
+        field layout live on the dataclass.
+
+        :return: The request body ready for the enqueue endpoint.
+        """
+        return EventPayload(**kwargs).as_data(self.integration_key)
+
     def resolve_event(self, event_id: str) -> None:
         """
         Resolve an event in PagerDuty.
 
-        :param event_id: The ID of the event to resolve.
+        :param event_id: The dedup key of the event to resolve.
         """
         try:
-            self._session.resolve_event(event_id)
-        except pagerduty.PagerDutyError as e:
+            self._post_enqueue(
+                {
+                    "routing_key": self.integration_key,
+                    "event_action": "resolve",
+                    "dedup_key": event_id,
+                }
+            )
+        except _CLIENT_ERRORS as e:
             raise AirflowException(f"Failed to resolve event: {e}") from e
 
     def send_change_event(
@@ -94,141 +385,57 @@ class EventsAPiV2Client:
         if routing_key is None:
             routing_key = self.integration_key
 
+        data = {"event_action": event_type, "routing_key": routing_key, **payload}
         try:
-            response = self._session.send_event(payload, event_type, routing_key)
-            return response['event']['id']
-        except pagerduty.PagerDutyError as e:
+            return self._post_enqueue(data)['event']['id']
+        except _CLIENT_ERRORS as e:
             raise AirflowException(f"Failed to send change event: {e}") from e
-    
-    def send_event(
-        self,
-        summary: str,
-        severity: str,
-        source: str,
-        custom_details: dict[str, Any] | None = None,
-        component: str | None = None,
-        group: str | None = None,
-        class_type: str | None = None,
-        action: str = "trigger",
-        dedup_key: str | None = None,
-        images: list[dict[str, Any]] | None = None,
-        links: list[dict[str, Any]] | None = None,
-    ) -> dict[str, Any]:
-        """
-        Send an event to PagerDuty.
-
-        :param summary: The summary of the event.
-        :param severity: The severity of the event.
-        :param source: The source of the event.
-        :param custom_details: Custom details for the event.
-        :param component: The component of the event.
-        :param group: The group of the event.
-        :param class_type: The class type of the event.
-        :param action: The action to take (trigger, acknowledge, resolve).
-        :param dedup_key: A deduplication key for the event.
-        :param images: Images associated with the event.
-        :param links: Links associated with the event.
-        :return: The response from PagerDuty.
-        """
-        payload = self.prepare_payload(
-            summary=summary,
-            severity=severity,
-            source=source,
-            custom_details=custom_details,
-            component=component,
-            group=group,
-            class_type=class_type,
-            action=action,
-            dedup_key=dedup_key,
-            images=images,
-            links=links,
-        )
-        return self.post_event(payload)
-    
-    def submit_event(
-        self,
-        summary: str,
-        severity: str,
-        source: str,
-        custom_details: dict[str, Any] | None = None,
-        component: str | None = None,
-        group: str | None = None,
-        class_type: str | None = None,
-        action: str = "trigger",
-        dedup_key: str | None = None,
-        images: list[dict[str, Any]] | None = None,
-        links: list[dict[str, Any]] | None = None,
-    ) -> dict[str, Any]:
-        """
-        Submit an event to PagerDuty.
-
-        :param summary: The summary of the event.
-        :param severity: The severity of the event.
-        :param source: The source of the event.
-        :param custom_details: Custom details for the event.
-        :param component: The component of the event.
-        :param group: The group of the event.
-        :param class_type: The class type of the event.
-        :param action: The action to take (trigger, acknowledge, resolve).
-        :param dedup_key: A deduplication key for the event.
-        :param images: Images associated with the event.
-        :param links: Links associated with the event.
-        :return: The response from PagerDuty.
-        """
-        return self.send_event(
-            summary=summary,
-            severity=severity,
-            source=source,
-            custom_details=custom_details,
-            component=component,
-            group=group,
-            class_type=class_type,
-            action=action,
-            dedup_key=dedup_key,
-            images=images,
-            links=links,
-        )
-    
-    def trigger_event(
-        self,
-        summary: str,
-        severity: str,
-        source: str,
-        custom_details: dict[str, Any] | None = None,
-        component: str | None = None,
-        group: str | None = None,
-        class_type: str | None = None,
-        action: str = "trigger",
-        dedup_key: str | None = None,
-        images: list[dict[str, Any]] | None = None,
-        links: list[dict[str, Any]] | None = None,
-    ) -> dict[str, Any]:
-        """
-        Trigger an event in PagerDuty.
-
-        :param summary: The summary of the event.
-        :param severity: The severity of the event.
-        :param source: The source of the event.
-        :param custom_details: Custom details for the event.
-        :param component: The component of the event.
-        :param group: The group of the event.
-        :param class_type: The class type of the event.
-        :param action: The action to take (trigger, acknowledge, resolve).
-        :param dedup_key: A deduplication key for the event.
-        :param images: Images associated with the event.
-        :param links: Links associated with the event.
-        :return: The response from PagerDuty.
-        """
-        return self.send_event(
-            summary=summary,
-            severity=severity,
-            source=source,
-            custom_details=custom_details,
-            component=component,
-            group=group,
-            class_type=class_type,
-            action=action,
-            dedup_key=dedup_key,
-            images=images,
-            links=links,
-        )
\ No newline at end of file
+
+    def _dispatch_event(self, **kwargs: Any) -> Future:
+        """
+        Prepare a single event payload and enqueue it on the batch queue.
+
+        Accepts the same keyword arguments as ``prepare_payload`` (``summary``,
+        ``severity`` and ``source``, plus the optional event fields) and returns a
+        Future resolved with this event's response once the flusher posts it.
+
+        :return: A Future resolved with this event's response once the flusher posts it.
+        """
+        return self._batch_queue.put(self.prepare_payload(**kwargs))
+
+    send_event = _dispatch_event
+    submit_event = _dispatch_event
+    trigger_event = _dispatch_event
+
+    async def a_post_event(self, payload: dict[str, Any]) -> str:
+        """
+        Post an event to PagerDuty without blocking the event loop.
+
+        :param payload: The event payload to send to PagerDuty.
+        :return: The ID of the created event.
+        """
+        if not _HAS_HTTPX:
+            raise AirflowException("httpx with the h2 extra is required for async event submission.")
+        try:
+            response = await _get_async_client().post(
+                _EVENTS_ENQUEUE_URL, content=_encode(payload), headers=dict(self._headers)
+            )
+            response.raise_for_status()
+            return response.json()['event']['id']
+        except _CLIENT_ERRORS as e:
+            raise AirflowException(f"Failed to post event: {e}") from e
+
+    async def _a_dispatch_event(self, **kwargs: Any) -> str:
+        """
+        Prepare a single event payload and post it asynchronously.
+
+        Accepts the same keyword arguments as ``prepare_payload``. Many calls can
+        be overlapped with ``asyncio.gather`` so N submissions share one event
+        loop iteration and one multiplexed connection.
+
+        :return: The ID of the created event.
+        """
+        return await self.a_post_event(self.prepare_payload(**kwargs))
+
+    a_send_event = _a_dispatch_event
+    a_trigger_event = _a_dispatch_event
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import pagerduty
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from airflow.exceptions import AirflowException
 from airflow.hooks.base import BaseHook
@@ -10,6 +16,62 @@ from airflow.hooks.base import BaseHook
 if TYPE_CHECKING:
     from datetime import datetime
 
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=128)
+def _resolve_integration_key(conn_id: str) -> str | None:
+    """
+    Resolve the integration key stored in an Airflow connection.
+
+    Hooks are typically constructed once per task, and each construction used to
+    hit the metadata database. Caching by connection id means N tasks sharing a
+    connection share one lookup; call ``_resolve_integration_key.cache_clear()``
+    after updating a connection to pick up the new key.
+    """
+    return BaseHook.get_connection(conn_id).get_password()
+
+
+def _build_headers(integration_key: str) -> Mapping[str, str]:
+    """
+    Build the read-only request headers for an integration key.
+
+    Returned as a ``MappingProxyType`` so the one dict built at construction time
+    can be handed out on every request without per-call allocation or mutation.
+    """
+    return MappingProxyType(
+        {
+            "Authorization": f"Token token={integration_key}",
+            "Content-Type": "application/json",
+        }
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_session(integration_key: str) -> requests.Session:
+    """
+    Return a process-wide ``requests.Session`` for the given integration key.
+
+    Sessions are cached per key so that repeated client construction (one hook per
+    task is common in Airflow) reuses the same keep-alive connection pool instead
+    of paying a TCP+TLS handshake per request. The pool sizes are tuned for
+    Airflow worker concurrency.
+    """
+    session = requests.Session()
+    session.headers.update(_build_headers(integration_key))
+    retry = Retry(
+        total=ApiClient.max_http_attempts,
+        connect=ApiClient.max_network_attempts,
+        backoff_factor=ApiClient.sleep_timer_base,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(ApiClient.permitted_methods),
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class ApiClient:
     """
     The ApiClient is a client for the PagerDuty API.
@@ -22,8 +84,7 @@ class ApiClient:
         self._session = None
 
         if pagerduty_events_conn_id is not None:
-            conn = self.get_connection(pagerduty_events_conn_id)
-            self.integration_key = conn.get_password()
+            self.integration_key = _resolve_integration_key(pagerduty_events_conn_id)
 
         if integration_key is not None:  # token takes higher priority
             self.integration_key = integration_key
@@ -32,28 +93,24 @@ class ApiClient:
             raise AirflowException(
                 "Cannot get token: No valid integration key nor pagerduty_events_conn_id supplied."
             )
-    def after_set_api_key(self) -> None:
-        """
-        After setting the API key, this method is called to initialize the session.
-        """
-        self._session = pagerduty.APISession(self.integration_key)
-        self._session.headers.update(self.prepare_headers())
-    
+
+        self._headers = _build_headers(self.integration_key)
+        self._session = _get_session(self.integration_key)
+
     @property
     def api_key(self) -> str:
         """
         The API key used for authentication.
         """
-        return self._session.api_key
+        return self.integration_key
 
     @property
     def auth_header(self) -> dict:
         """
         The authentication header used for API requests.
         """
-        return self._session.auth_header
+        return {"Authorization": self._headers["Authorization"]}
 
-    log=None
     max_http_attempts = 10
     max_network_attempts = 3
 
@@ -71,13 +128,7 @@ class ApiClient:
 
     parent = None
 
-    permitted_methods = [
-        'GET',
-        'POST',
-        'PUT',
-        'DELETE',
-        'PATCH',
-    ]
+    permitted_methods: ClassVar[frozenset[str]] = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
 
     def postprocess(response: Any) -> Any:
         """
@@ -85,33 +136,55 @@ class ApiClient:
         """
         return response
 
-    def prepare_headers(method,user_headers={})->dict:
-
-        return user_headers
+    def prepare_headers(self) -> Mapping[str, str]:
+        """
+        Return the headers for API requests, built once at construction time.
+        """
+        return self._headers
 
 
 
-    print_debug = False
-    if print_debug is True:
-        log = logging.DEBUG
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> Any:
         """
-        Print debug information.
-        """
-        print(log)
-    log = logging.NOTSET
+        Make a request to the PagerDuty API over the shared keep-alive session.
 
-    def request(method, url, **kwargs) -> Any:
-        """
-        Make a request to the PagerDuty API.
+        Retries for transient failures are handled by the retry policy mounted on
+        the session adapter, built from ``max_http_attempts``,
+        ``max_network_attempts`` and ``sleep_timer_base``.
 
-        :param method: The HTTP method to use (GET, POST, PUT, DELETE).
+        :param method: The HTTP method to use (GET, POST, PUT, DELETE, PATCH).
         :param url: The URL for the API endpoint.
+        :param params: Query parameters for the request.
+        :param data: The request body.
+        :param headers: Extra headers, merged over the client defaults.
         :param kwargs: Additional arguments to pass to the request.
         :return: The response from the API.
         """
-        # Perform the request using the session
-        response = self._session.request(method, url, params=params, data=data, headers=headers, **kwargs)
-        return response
+        if method not in self.permitted_methods:
+            raise AirflowException(
+                f"Method {method} is not permitted; must be one of: {', '.join(sorted(self.permitted_methods))}"
+            )
+        merged_headers = dict(self._headers)
+        if headers:
+            merged_headers.update(headers)
+        kwargs.setdefault("timeout", self.timeout)
+        return self._session.request(
+            method,
+            self.normalize_url(url),
+            params=self.normalize_params(params) if params is not None else None,
+            data=data,
+            headers=merged_headers,
+            **kwargs,
+        )
 
     retry = {}
 